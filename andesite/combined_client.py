@@ -13,9 +13,10 @@ for `ClientPool` clients!
 
 import asyncio
 from contextlib import suppress
-from typing import Any, Dict, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Union
 
 import aiobservable
+import aiohttp
 from yarl import URL
 
 import andesite
@@ -171,6 +172,15 @@ class ClientBase(aiobservable.Observable, andesite.AbstractWebSocket, andesite.A
         """
         return await self.http.request(method, path, **kwargs)
 
+    async def request_tracks_stream(self, identifier: str) -> AsyncIterator[Dict[str, Any]]:
+        """Load tracks using the http client and yield the raw data of each track.
+
+        See Also:
+            Refer to `AbstractHTTP.request_tracks_stream` for the documentation.
+        """
+        async for track in self.http.request_tracks_stream(identifier):
+            yield track
+
 
 class Client(andesite.WebSocketInterface, andesite.HTTPInterface, ClientBase):
     """Andesite client which combines the web socket with the http client.
@@ -193,7 +203,9 @@ class Client(andesite.WebSocketInterface, andesite.HTTPInterface, ClientBase):
 
 def create_client(http_uri: Union[str, URL], web_socket_uri: Union[str, URL], password: Optional[str],
                   user_id: int, *,
-                  state: andesite.StateArgumentType = None) -> Client:
+                  state: andesite.StateArgumentType = None,
+                  connector: aiohttp.BaseConnector = None,
+                  local_decoder: Callable[[str], Dict[str, Any]] = None) -> Client:
     """Create a new combined Andesite client.
 
     Args:
@@ -203,16 +215,23 @@ def create_client(http_uri: Union[str, URL], web_socket_uri: Union[str, URL], pa
         user_id: User ID
         state: State handler to use. Defaults to in-memory `State`.
             You can pass `False` to disable state handling.
+        connector: Connector to use for the http client.
+            See `HTTPBase` for more details.
+        local_decoder: Local track decoder to use.
+            See `HTTPInterface.local_decoder`.
 
     Returns:
         A new combined client with `HTTPBase` and `WebSocketBase` as
         its clients.
     """
 
-    http_client = andesite.HTTPBase(http_uri, password)
+    http_client = andesite.HTTPBase(http_uri, password, connector=connector)
     web_socket_client = andesite.WebSocketBase(web_socket_uri, user_id, password)
 
     inst = Client(http_client, web_socket_client)
 
     inst.state = state
+    if local_decoder is not None:
+        inst.local_decoder = local_decoder
+
     return inst
@@ -122,8 +122,14 @@ class AsyncMethodGroup:
     def __init__(self, methods: Iterable[Callable]) -> None:
         self.methods = set(methods)
 
-    def __call__(self, obj: Any, *args, **kwargs) -> Future:
-        return asyncio.gather(func(*args, **kwargs) for func in self.methods)
+    def __call__(self, *args, **kwargs) -> Future:
+        methods = self.methods
+        if len(methods) == 1:
+            # a single task doesn't need to be wrapped in a gathering future
+            func, = methods
+            return asyncio.ensure_future(func(*args, **kwargs))
+
+        return asyncio.gather(*(func(*args, **kwargs) for func in methods))
 
 
 def get_async_method_group(obj: Any, name: str) -> AsyncMethodGroup:
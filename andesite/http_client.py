@@ -20,15 +20,27 @@ Attributes:
 """
 
 import abc
+import asyncio
 import logging
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, NoReturn, Optional, Set, Tuple, Union
 
 import aiohttp
 import yarl
 
 import andesite
-from .transform import build_from_raw, seq_build_all_items_from_raw
+from .transform import RawDataType, build_from_raw, seq_build_all_items_from_raw
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 __all__ = ["USER_AGENT", "HTTPError",
            "Searcher", "SearcherType", "get_searcher",
@@ -69,6 +81,17 @@ class Searcher(Enum):
 
 SearcherType = Union[Searcher, str]
 
+# searcher ids and service names (upper and lower case) of all searchers
+_SEARCHER_TABLE: Dict[str, Searcher] = {
+    key: searcher
+    for searcher in Searcher
+    for key in (searcher.value, searcher.name, searcher.name.lower())
+}
+
+
+# identifier prefix used to search with a searcher
+_SEARCH_PREFIXES: Dict[Searcher, str] = {searcher: f"{searcher.value}:" for searcher in Searcher}
+
 
 def get_searcher(searcher: SearcherType) -> Searcher:
     """Get the `Searcher` for the given `SearcherType`.
@@ -92,19 +115,31 @@ def get_searcher(searcher: SearcherType) -> Searcher:
     if isinstance(searcher, Searcher):
         return searcher
     elif isinstance(searcher, str):
-        try:
-            return Searcher[searcher.upper()]
-        except KeyError:
-            # if this causes a ValueError, just let it raise
-            return Searcher(searcher)
+        resolved = _SEARCHER_TABLE.get(searcher)
+        if resolved is None:
+            resolved = _SEARCHER_TABLE.get(searcher.upper())
+            if resolved is None:
+                raise ValueError(f"{searcher!r} is not a valid {Searcher.__name__}")
+
+        return resolved
     else:
         raise TypeError(f"Can only resolve {SearcherType}, not {type(searcher)}: {searcher}")
 
 
 class AbstractHTTP(abc.ABC):
-    """Abstract base class which requires a request method and a close method."""
+    """Abstract base class which requires a request method and a close method.
+
+    The client can be used as an async context manager which closes the
+    client when exited.
+    """
     __slots__ = ()
 
+    async def __aenter__(self) -> "AbstractHTTP":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
     @property
     @abc.abstractmethod
     def closed(self) -> bool:
@@ -148,15 +183,64 @@ class AbstractHTTP(abc.ABC):
         """
         ...
 
+    async def request_tracks_stream(self, identifier: str) -> AsyncIterator[RawDataType]:
+        """Load tracks and yield the raw data of each track.
+
+        This default implementation loads the entire response using `request`
+        before yielding the tracks. Clients which are able to parse the response
+        while it is being received should override it.
+
+        Args:
+            identifier: Identifier to load.
+
+        Returns:
+            Async iterator of the raw track data.
+
+        Raises:
+            HTTPError: If Andesite returns an error.
+            AndesiteException: If Andesite failed to load the tracks.
+        """
+        data = await self.request("GET", "loadtracks", params={"identifier": identifier})
+        _raise_load_failed(data.get("cause"))
+
+        for track in data.get("tracks") or ():
+            yield track
+
 
 class HTTPInterface(AbstractHTTP, abc.ABC):
     """Abstract implementation of the endpoints.
 
     This does not include the player routes, as they are already covered by the `WebSocket`.
     The client uses the user agent `USER_AGENT` for every request.
+
+    Attributes:
+        local_decoder (Optional[Callable[[str], RawDataType]]): Function which
+            decodes an encoded track locally (ex: using
+            `lptrack <https://github.com/gieseladev/lptrack>`_).
+            It must return the same raw data Andesite returns for the track.
+            If set, `decode_track` and `decode_tracks` run it in the default
+            executor instead of sending a request. If it fails, the tracks
+            are decoded by Andesite instead.
+        decode_batch_delay (Optional[float]): Amount of seconds `decode_track`
+            waits for other calls before decoding all the collected tracks
+            in a single request. Set to `None` to send a request per call.
+        decode_cache_size (int): Maximum amount of decoded tracks which
+            are kept by `decode_track` and `decode_tracks` so that the
+            same encoded track isn't decoded again. The least recently
+            used tracks are dropped first. Set to 0 to disable the cache.
+            Note that cached `TrackInfo` instances are shared between all
+            callers which decode the same track, they shouldn't be mutated.
     """
     __slots__ = ()
 
+    local_decoder: Optional[Callable[[str], RawDataType]] = None
+    decode_batch_delay: Optional[float] = 0.005
+    decode_cache_size: int = 4096
+
+    __decode_batch: List[Tuple[str, asyncio.Future]]
+    __decode_flush_tasks: Set[asyncio.Task]
+    __decode_cache: "OrderedDict[str, andesite.TrackInfo]"
+
     async def get_stats(self) -> andesite.Stats:
         """Get the node's statistics.
 
@@ -179,9 +263,35 @@ class HTTPInterface(AbstractHTTP, abc.ABC):
         See Also:
             `search_tracks` to search for a track using a query.
         """
-        data = await self.request("GET", "loadtracks", params=dict(identifier=identifier))
+        data = await self.request("GET", "loadtracks", params={"identifier": identifier})
         return build_from_raw(andesite.LoadedTrack, data)
 
+    async def load_tracks_stream(self, identifier: str) -> AsyncIterator[andesite.TrackInfo]:
+        """Load tracks and parse them while the response is being received.
+
+        Instead of loading the entire response before building the tracks,
+        the tracks are parsed and yielded one by one. `HTTP` requires
+        `ijson <https://github.com/ICRAR/ijson>`_ for this, if it isn't installed
+        the response is loaded as a whole first.
+
+        Args:
+            identifier: Identifier to load. The identifier isn't handled in any way
+                so it supports the search syntax for example.
+
+        Returns:
+            Async iterator of the loaded tracks. Only the tracks are
+            yielded, use `load_tracks` if you need the other information
+            of the response (ex: the load type or the playlist info).
+            If there are no matches, nothing is yielded.
+
+        Raises:
+            HTTPError: If Andesite returns an error.
+            AndesiteException: If Andesite failed to load the tracks
+                (i.e. the load type is `LoadType.LOAD_FAILED`).
+        """
+        async for track in self.request_tracks_stream(identifier):
+            yield build_from_raw(andesite.TrackInfo, track)
+
     async def load_tracks_safe(self, uri: str) -> andesite.LoadedTrack:
         """Load tracks from url.
 
@@ -218,8 +328,11 @@ class HTTPInterface(AbstractHTTP, abc.ABC):
             A search query is just an identifier with the format
             "<searcher>:<query>".
         """
-        searcher_id = get_searcher(searcher).value
-        return await self.load_tracks(f"{searcher_id}:{query}")
+        prefix = _SEARCH_PREFIXES.get(searcher)
+        if prefix is None:
+            prefix = _SEARCH_PREFIXES[get_searcher(searcher)]
+
+        return await self.load_tracks(prefix + query)
 
     async def decode_track(self, track: str) -> Optional[andesite.TrackInfo]:
         """Get the `TrackInfo` from the encoded track data.
@@ -240,21 +353,102 @@ class HTTPInterface(AbstractHTTP, abc.ABC):
         See Also:
             Please use `decode_tracks` if you need to decode multiple
             encoded strings at once!
+            `decode_batch_delay` to control how calls are combined.
         """
+        track_info = self.__get_cached_track(track)
+        if track_info is None:
+            track_info = await self.__decode_track(track)
+            if track_info is not None:
+                self.__cache_track(track, track_info)
+
+        return track_info
+
+    async def __decode_track(self, track: str) -> Optional[andesite.TrackInfo]:
+        """Decode a track which isn't cached."""
+        decoded = await self._decode_locally([track])
+        if decoded is not None:
+            return build_from_raw(andesite.TrackInfo, decoded[0])
+
+        if self.decode_batch_delay is None:
+            return await self.__request_decode_track(track)
+
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+
         try:
-            data = await self.request("POST", "decodetrack", json=dict(track=track))
+            batch = self.__decode_batch
+        except AttributeError:
+            batch = self.__decode_batch = []
+
+        if not batch:
+            loop.call_later(self.decode_batch_delay, self.__start_decode_flush)
+
+        batch.append((track, future))
+        return await future
+
+    async def __request_decode_track(self, track: str) -> Optional[andesite.TrackInfo]:
+        """Decode a single track using the decodetrack endpoint."""
+        try:
+            data = await self.request("POST", "decodetrack", json={"track": track})
         except HTTPError as e:
-            if log.isEnabledFor(logging.DEBUG):
-                log.debug(f"Couldn't decode track: {e}")
+            log.debug("Couldn't decode track: %s", e)
             return None
         else:
             return build_from_raw(andesite.TrackInfo, data)
 
-    async def decode_tracks(self, tracks: Iterable[str]) -> List[andesite.TrackInfo]:
+    def __start_decode_flush(self) -> None:
+        """Start a task which decodes the tracks collected by `decode_track`.
+
+        A reference to the task is kept until it's done so it isn't
+        garbage collected while it's running.
+        """
+        try:
+            tasks = self.__decode_flush_tasks
+        except AttributeError:
+            tasks = self.__decode_flush_tasks = set()
+
+        task = asyncio.get_event_loop().create_task(self.__flush_decode_batch())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def __flush_decode_batch(self) -> None:
+        """Decode the tracks collected by `decode_track`.
+
+        If the batch can't be decoded at once because of an
+        `HTTPError`, the tracks are decoded separately.
+        """
+        batch = self.__decode_batch
+        self.__decode_batch = []
+
+        tracks = [track for track, _ in batch]
+
+        try:
+            if len(tracks) == 1:
+                results = [await self.__request_decode_track(tracks[0])]
+            else:
+                try:
+                    results = await self.decode_tracks(tracks)
+                except HTTPError as e:
+                    log.debug("Couldn't decode batch of %s tracks, decoding separately: %s", len(tracks), e)
+                    results = await asyncio.gather(*(self.__request_decode_track(track) for track in tracks))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def decode_tracks(self, tracks: Iterable[str], *, chunk_size: int = 100) -> List[andesite.TrackInfo]:
         """Get the `TrackInfo` from multiple encoded track data strings.
 
+        The tracks are split into chunks which are decoded by
+        concurrent requests.
+
         Args:
             tracks: `Iterable` of base 64 encoded track data to decode.
+            chunk_size: Maximum amount of tracks to decode per request.
 
         Returns:
             List of `TrackInfo` in order of the provided tracks.
@@ -262,10 +456,103 @@ class HTTPInterface(AbstractHTTP, abc.ABC):
         Raises:
             HTTPError: If Andesite returns an error.
         """
-        data = await self.request("POST", "decodetracks", json=list(tracks))
+        # lists can be used as they are, only other iterables have to be materialised
+        if not isinstance(tracks, list):
+            tracks = list(tracks)
+
+        track_infos = [self.__get_cached_track(track) for track in tracks]
+
+        # dict to get rid of duplicates while keeping the order
+        missing = list(dict.fromkeys(track for track, track_info in zip(tracks, track_infos) if track_info is None))
+        if not missing:
+            return track_infos
+
+        decoded = dict(zip(missing, await self.__decode_tracks(missing, chunk_size)))
+        for track, track_info in decoded.items():
+            self.__cache_track(track, track_info)
+
+        return [decoded[track] if track_info is None else track_info
+                for track, track_info in zip(tracks, track_infos)]
+
+    async def __decode_tracks(self, tracks: List[str], chunk_size: int) -> List[andesite.TrackInfo]:
+        """Decode tracks which aren't cached."""
+        decoded = await self._decode_locally(tracks)
+        if decoded is not None:
+            seq_build_all_items_from_raw(decoded, andesite.TrackInfo)
+            return decoded
+
+        if len(tracks) <= chunk_size:
+            data = await self.request("POST", "decodetracks", json=tracks)
+        else:
+            chunks = await asyncio.gather(*(self.request("POST", "decodetracks", json=tracks[i:i + chunk_size])
+                                            for i in range(0, len(tracks), chunk_size)))
+
+            data = [track_data for chunk in chunks for track_data in chunk]
+
         seq_build_all_items_from_raw(data, andesite.TrackInfo)
         return data
 
+    def __get_cached_track(self, track: str) -> Optional[andesite.TrackInfo]:
+        """Get a track from the decode cache.
+
+        Returns:
+            The cached `TrackInfo`, `None` if the track isn't cached.
+        """
+        try:
+            cache = self.__decode_cache
+        except AttributeError:
+            return None
+
+        track_info = cache.get(track)
+        if track_info is not None:
+            cache.move_to_end(track)
+
+        return track_info
+
+    def __cache_track(self, track: str, track_info: andesite.TrackInfo) -> None:
+        """Add a decoded track to the decode cache.
+
+        If the cache exceeds `decode_cache_size`, the least recently
+        used tracks are removed.
+        """
+        max_size = self.decode_cache_size
+        if max_size <= 0:
+            return
+
+        try:
+            cache = self.__decode_cache
+        except AttributeError:
+            cache = self.__decode_cache = OrderedDict()
+
+        cache[track] = track_info
+        cache.move_to_end(track)
+
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+    async def _decode_locally(self, tracks: List[str]) -> Optional[List[RawDataType]]:
+        """Decode tracks using the `local_decoder`.
+
+        Args:
+            tracks: Encoded tracks to decode.
+
+        Returns:
+            Raw data of the decoded tracks in order of the provided tracks.
+            `None` if there is no local decoder or it failed to decode
+            any of the tracks.
+        """
+        local_decoder = self.local_decoder
+        if local_decoder is None:
+            return None
+
+        loop = asyncio.get_event_loop()
+
+        try:
+            return list(await asyncio.gather(*(loop.run_in_executor(None, local_decoder, track) for track in tracks)))
+        except Exception:
+            log.debug("local decoder failed, decoding tracks using Andesite", exc_info=True)
+            return None
+
 
 class HTTPBase(AbstractHTTP):
     """Standard implementation of `AbstractHTTP`.
@@ -273,6 +560,31 @@ class HTTPBase(AbstractHTTP):
     Args:
         password: Password to use for authorization. Use `None` if
             the Andesite node does not have a password set.
+        connector: Connector to create the client session with.
+            The connector isn't owned by the client, it can be shared
+            between multiple clients (ex: a single
+            `aiohttp.TCPConnector` for the entire process) and is kept
+            across `reset` calls. The caller is responsible for closing it.
+        session: Client session to use for requests instead of
+            creating one. The session isn't closed by `close`.
+        limit: Total number of simultaneous connections of the
+            connector created by the client. Ignored if `connector` or
+            `session` is passed. 0 means no limit.
+        limit_per_host: Number of simultaneous connections to the same
+            endpoint for the connector created by the client.
+            Ignored if `connector` or `session` is passed. 0 means no limit.
+
+    If you create multiple clients (ex: one per node), they can share a
+    single connection pool by passing the same connector to all of them:
+
+    .. code-block:: python
+
+        connector = aiohttp.TCPConnector(limit_per_host=32, keepalive_timeout=120)
+
+        clients = [HTTP(uri, password, connector=connector) for uri, password in nodes]
+        ...
+        # the connector isn't owned by the clients, close it yourself
+        await connector.close()
 
     See Also:
         `HTTP` for the client which includes the
@@ -280,11 +592,21 @@ class HTTPBase(AbstractHTTP):
     """
 
     __base_url: yarl.URL
+    __url_cache: Dict[str, yarl.URL]
     __session: Optional[aiohttp.ClientSession]
     __headers: Dict[str, str]
-
-    def __init__(self, uri: Union[str, yarl.URL], password: Optional[str]) -> None:
-        self.__base_url = yarl.URL(uri)
+    __connector: Optional[aiohttp.BaseConnector]
+    __limit: int
+    __limit_per_host: int
+    __external_session: Optional[aiohttp.ClientSession]
+
+    def __init__(self, uri: Union[str, yarl.URL], password: Optional[str], *,
+                 connector: aiohttp.BaseConnector = None,
+                 session: aiohttp.ClientSession = None,
+                 limit: int = 100,
+                 limit_per_host: int = 0) -> None:
+        self.__base_url = base_url = yarl.URL(uri)
+        self.__url_cache = {path: base_url / path for path in ("stats", "loadtracks", "decodetrack", "decodetracks")}
 
         headers = {"User-Agent": USER_AGENT}
 
@@ -293,7 +615,11 @@ class HTTPBase(AbstractHTTP):
 
         self.__headers = headers
 
-        self.__session = None
+        self.__connector = connector
+        self.__limit = limit
+        self.__limit_per_host = limit_per_host
+        self.__external_session = session
+        self.__session = session
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}(uri={self.__base_url!r}, password=[HIDDEN])"
@@ -301,12 +627,33 @@ class HTTPBase(AbstractHTTP):
     def __str__(self) -> str:
         return f"{type(self).__name__}({self.__base_url})"
 
+    @property
+    def base_url(self) -> yarl.URL:
+        """Base url of the Andesite node."""
+        return self.__base_url
+
     @property
     def aiohttp_session(self) -> aiohttp.ClientSession:
         """Client session used to make requests."""
         if self.__session is None:
-            log.info("creating aiohttp client session for %s", self)
-            self.__session = aiohttp.ClientSession(headers=self.__headers)
+            if self.__external_session is not None:
+                self.__session = self.__external_session
+            else:
+                log.info("creating aiohttp client session for %s", self)
+                connector = self.__connector
+                if connector is None:
+                    self.__session = aiohttp.ClientSession(
+                        headers=self.__headers,
+                        connector=aiohttp.TCPConnector(limit=self.__limit,
+                                                       limit_per_host=self.__limit_per_host,
+                                                       keepalive_timeout=120,
+                                                       ttl_dns_cache=300,
+                                                       enable_cleanup_closed=True),
+                    )
+                else:
+                    self.__session = aiohttp.ClientSession(headers=self.__headers,
+                                                           connector=connector,
+                                                           connector_owner=False)
 
         return self.__session
 
@@ -318,39 +665,156 @@ class HTTPBase(AbstractHTTP):
         return False
 
     async def close(self) -> None:
-        if self.__session:
+        if self.__session is not None and self.__session is self.__external_session:
+            log.debug("%s: not closing external aiohttp session", self)
+        elif self.__session:
             log.info("%s: closing aiohttp session", self)
             await self.__session.close()
         else:
             log.debug("%s: called close without ever creating a session, doing nothing", self)
 
     async def reset(self) -> None:
-        log.debug("resetting ")
+        log.debug("resetting %s", self)
+        session = self.__session
         self.__session = None
 
-    async def request(self, method: str, path: str, **kwargs) -> Any:
-        url = self.__base_url / path
+        # the connector isn't closed if it was passed to the constructor
+        if session is not None and session is not self.__external_session and not session.closed:
+            log.info("%s: closing old aiohttp session", self)
+            await session.close()
 
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug(f"performing {method} request for endpoint {path} with arguments: {kwargs}")
+    async def request(self, method: str, path: Union[str, yarl.URL], **kwargs) -> Any:
+        """Perform a request and return the JSON response.
+
+        Args:
+            method: HTTP method to use
+            path: Path relative to the base url. Must not start with a slash!
+                This may also be a prebuilt `yarl.URL` (ex: created from
+                `base_url`) which is used as is.
+            **kwargs: Keyword arguments passed to the request
+
+        Raises:
+            HTTPError: If Andesite returns an error.
+        """
+        url = self.__prepare_request(path, kwargs)
+
+        log.debug("performing %s request for endpoint %s with arguments: %s", method, path, kwargs)
 
         async with self.aiohttp_session.request(method, url, **kwargs) as resp:
-            data = await resp.json(content_type=None)
+            body = await resp.read()
+
+            if resp.status < 400:
+                data = _json_loads(body) if body.strip() else None
+                log.debug("got data: %s", data)
+                return data
+
+            _raise_error(resp, body)
 
-            if log.isEnabledFor(logging.DEBUG):
-                log.debug(f"got data: {data}")
+    async def request_tracks_stream(self, identifier: str) -> AsyncIterator[RawDataType]:
+        """Load tracks and yield the raw data of each track while the response is being received.
 
+        This requires `ijson <https://github.com/ICRAR/ijson>`_, if it isn't installed
+        the response is loaded as a whole first.
+
+        See Also:
+            `AbstractHTTP.request_tracks_stream` for the documentation.
+        """
+        if ijson is None:
+            async for track in super().request_tracks_stream(identifier):
+                yield track
+
+            return
+
+        kwargs = {"params": {"identifier": identifier}}
+        url = self.__prepare_request("loadtracks", kwargs)
+
+        log.debug("performing streamed GET request for endpoint loadtracks with arguments: %s", kwargs)
+
+        async with self.aiohttp_session.get(url, **kwargs) as resp:
             if resp.status >= 400:
-                try:
-                    code = data["code"]
-                    message = data["message"]
-                except KeyError:
-                    log.debug("Couldn't extract keys \"code\" and \"message\" from data, letting aiohttp raise!")
-                    resp.raise_for_status()
-                else:
-                    raise HTTPError(code, message)
+                _raise_error(resp, await resp.read())
+
+            # builder of the track or cause currently being parsed
+            builder: Optional[ijson.ObjectBuilder] = None
+
+            async for prefix, event, value in ijson.parse(resp.content, use_float=True):
+                if builder is None:
+                    if event == "start_map" and (prefix == "tracks.item" or prefix == "cause"):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+
+                    continue
+
+                builder.event(event, value)
+
+                if event == "end_map" and prefix == "tracks.item":
+                    yield builder.value
+                    builder = None
+                elif event == "end_map" and prefix == "cause":
+                    _raise_load_failed(builder.value)
+
+    def __prepare_request(self, path: Union[str, yarl.URL], kwargs: Dict[str, Any]) -> yarl.URL:
+        """Get the url for the path and add the headers to the keyword arguments if necessary.
+
+        Args:
+            path: Path or url passed to `request`.
+            kwargs: Keyword arguments for the request.
+                They are mutated in place.
+
+        Returns:
+            Url to perform the request on.
+        """
+        if self.__external_session is not None:
+            # the external session doesn't know about our headers
+            headers = kwargs.get("headers")
+            kwargs["headers"] = {**self.__headers, **headers} if headers else self.__headers
+
+        if isinstance(path, yarl.URL):
+            return path
+
+        return self.__url_cache.get(path) or self.__base_url / path
+
+
+def _raise_load_failed(cause: Optional[RawDataType]) -> None:
+    """Raise the cause of a failed track load.
+
+    Args:
+        cause: Raw `Error` sent by Andesite in the load tracks response.
+            Andesite only sends it if the load failed, nothing is raised
+            if this is `None`.
+
+    Raises:
+        AndesiteException: If a cause is passed.
+    """
+    if cause is not None:
+        build_from_raw(andesite.Error, cause).raise_error()
+
+
+def _raise_error(resp: aiohttp.ClientResponse, body: bytes) -> NoReturn:
+    """Raise the error for an error response.
+
+    Args:
+        resp: Response with an error status.
+        body: Body of the response.
+
+    Raises:
+        HTTPError: If the body contains the error code and message.
+        aiohttp.ClientResponseError: If the body doesn't contain the error.
+    """
+    try:
+        data = _json_loads(body) if body.strip() else None
+    except ValueError:
+        # error pages sent by a proxy in front of Andesite aren't JSON
+        data = None
+
+    log.debug("got error data: %s", data)
+
+    # the message may be null, only the presence of the keys matters
+    if not (isinstance(data, dict) and "code" in data and "message" in data):
+        log.debug("Couldn't extract keys \"code\" and \"message\" from data, letting aiohttp raise!")
+        resp.raise_for_status()
 
-            return data
+    raise HTTPError(data["code"], data["message"])
 
 
 class HTTP(HTTPBase, HTTPInterface):
@@ -6,17 +6,20 @@ used to represent an Andesite error.
 """
 
 from dataclasses import dataclass
-from typing import List, NoReturn, Optional
+from enum import Enum
+from sys import intern
+from typing import List, NoReturn, Optional, Tuple
 
-from andesite.transform import RawDataType, map_build_values_from_raw, map_convert_values, map_rename_keys, \
-    seq_build_all_items_from_raw
+from andesite.transform import RawDataType, build_from_raw, map_build_values_from_raw, seq_build_all_items_from_raw
 
 __all__ = ["StackFrame", "Error", "AndesiteException",
            "PlayersStats", "RuntimeVMStats", "RuntimeSpecStats", "RuntimeVersionStats", "RuntimeStats", "OSStats", "CPUStats", "ClassLoadingStats",
-           "ThreadStats", "CompilationStats", "MemoryCommonUsageStats", "MemoryStats", "GCStats", "MemoryPoolStats", "MemoryManagerStats",
+           "ThreadStats", "CompilationStats", "MemoryCommonUsageStats", "MemoryStats", "GCStats", "MemoryPoolType", "MemoryPoolStats", "MemoryManagerStats",
            "FrameStats",
            "Stats"]
 
+_STACK_FRAME_INTERNED_KEYS: Tuple[str, ...] = ("class_loader", "module_name", "module_version", "class_name", "method_name", "file_name")
+
 
 @dataclass
 class StackFrame:
@@ -34,6 +37,9 @@ class StackFrame:
         line_number (Optional[int]): line in the source file
         pretty (str): pretty printed version of this frame, as it would appear on Throwable#printStackTrace
     """
+    __slots__ = ("class_loader", "module_name", "module_version", "class_name", "method_name", "file_name",
+                 "line_number", "pretty")
+
     class_loader: Optional[str]
     module_name: Optional[str]
     module_version: Optional[str]
@@ -43,13 +49,24 @@ class StackFrame:
     line_number: Optional[int]
     pretty: str
 
+    @classmethod
+    def __transform_input__(cls, data: RawDataType) -> None:
+        # the same names show up in almost every frame of a trace
+        for key in _STACK_FRAME_INTERNED_KEYS:
+            value = data.get(key)
+            if value is not None:
+                data[key] = intern(value)
+
     def __str__(self) -> str:
         spec: List[str] = []
 
-        for name, value in [("module", self.module_name), ("file", self.file_name), ("line", self.line_number)]:
-            # only show 'em if we know 'em
-            if value is not None:
-                spec.append(f"{name} {value}")
+        # only show 'em if we know 'em
+        if self.module_name is not None:
+            spec.append(f"module {self.module_name}")
+        if self.file_name is not None:
+            spec.append(f"file {self.file_name}")
+        if self.line_number is not None:
+            spec.append(f"line {self.line_number}")
 
         spec.append(f"{self.class_name}#{self.method_name}")
 
@@ -71,6 +88,8 @@ class Error:
         cause (Optional[Error]): cause of the error
         suppressed (List[Error]): suppressed errors
     """
+    __slots__ = ("class_name", "message", "stack", "suppressed", "cause")
+
     class_name: str
     message: Optional[str]
     stack: List[StackFrame]
@@ -81,8 +100,21 @@ class Error:
     def __transform_input__(cls, data: RawDataType) -> None:
         seq_build_all_items_from_raw(data["stack"], StackFrame)
         seq_build_all_items_from_raw(data["suppressed"], Error)
-        map_build_values_from_raw(data, cause=Error)
-        map_rename_keys(data, class_name="class")
+
+        # build the cause chain from the innermost error outwards instead of
+        # recursing into it, JVM cause chains can be arbitrarily deep.
+        chain: List[RawDataType] = []
+        cause = data.get("cause")
+        while cause is not None and not isinstance(cause, Error):
+            chain.append(cause)
+            cause = cause.get("cause")
+
+        for raw_cause in reversed(chain):
+            raw_cause["cause"] = cause
+            cause = build_from_raw(Error, raw_cause)
+
+        data["cause"] = cause
+        data["class_name"] = data.pop("class")
 
     def as_python_exception(self) -> "AndesiteException":
         """Create an `AndesiteException` which can be raised.
@@ -91,8 +123,12 @@ class Error:
         """
         exc = AndesiteException(self.class_name, self.message, self.stack, self.suppressed)
 
-        if self.cause is not None:
-            exc.__cause__ = self.cause.as_python_exception()
+        # link the cause chain iteratively, it can be deeper than the recursion limit
+        current_exc, cause = exc, self.cause
+        while cause is not None:
+            cause_exc = AndesiteException(cause.class_name, cause.message, cause.stack, cause.suppressed)
+            current_exc.__cause__ = cause_exc
+            current_exc, cause = cause_exc, cause.cause
 
         return exc
 
@@ -146,6 +182,8 @@ class PlayersStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("total", "playing")
+
     total: int
     playing: int
 
@@ -163,6 +201,8 @@ class RuntimeVMStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("name", "vendor", "version")
+
     name: str
     vendor: str
     version: str
@@ -181,6 +221,8 @@ class RuntimeSpecStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("name", "vendor", "version")
+
     name: str
     vendor: str
     version: str
@@ -203,6 +245,8 @@ class RuntimeVersionStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("feature", "interim", "update", "patch", "pre", "build", "optional")
+
     feature: int
     interim: int
     update: int
@@ -229,6 +273,8 @@ class RuntimeStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("uptime", "pid", "management_spec_version", "name", "vm", "spec", "version")
+
     uptime: int
     pid: int
     management_spec_version: str
@@ -256,6 +302,8 @@ class OSStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("processors", "name", "arch", "version")
+
     processors: int
     name: str
     arch: str
@@ -274,6 +322,8 @@ class CPUStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("andesite", "system")
+
     andesite: float
     system: float
 
@@ -287,6 +337,8 @@ class ClassLoadingStats:
         total_loaded (int)
         unloaded (int)
     """
+    __slots__ = ("loaded", "total_loaded", "unloaded")
+
     loaded: int
     total_loaded: int
     unloaded: int
@@ -306,6 +358,8 @@ class ThreadStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("running", "daemon", "peak", "total_started")
+
     running: int
     daemon: int
     peak: int
@@ -324,6 +378,8 @@ class CompilationStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("name", "total_time")
+
     name: str
     total_time: int
 
@@ -342,6 +398,8 @@ class MemoryCommonUsageStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("init", "used", "committed", "max")
+
     init: int
     used: int
     committed: int
@@ -361,6 +419,8 @@ class MemoryStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("pending_finalization", "heap", "non_heap")
+
     pending_finalization: int
     heap: MemoryCommonUsageStats
     non_heap: MemoryCommonUsageStats
@@ -384,19 +444,31 @@ class GCStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("name", "collection_count", "collection_time", "pools")
+
     name: str
     collection_count: int
     collection_time: int
     pools: List[str]
 
 
+class MemoryPoolType(str, Enum):
+    """Type of a memory pool.
+
+    The members are `str` instances, so they compare equal to
+    the raw values sent by Andesite.
+    """
+    HEAP = "HEAP"
+    NON_HEAP = "NON_HEAP"
+
+
 @dataclass
 class MemoryPoolStats:
     """Memory pool statistics.
 
     Attributes:
         name (str): Name of the pool
-        type (str): Type of the pool. This is either "HEAP" or "NON_HEAP".
+        type (MemoryPoolType): Type of the pool
         collection_usage (Optional[MemoryHeapStats])
         collection_usage_threshold (Optional[int])
         collection_usage_threshold_count (Optional[int])
@@ -410,8 +482,11 @@ class MemoryPoolStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("name", "type", "collection_usage", "collection_usage_threshold", "collection_usage_threshold_count",
+                 "peak_usage", "usage", "usage_threshold", "usage_threshold_count", "managers")
+
     name: str
-    type: str
+    type: MemoryPoolType
     collection_usage: Optional[MemoryCommonUsageStats]
     collection_usage_threshold: Optional[int]
     collection_usage_threshold_count: Optional[int]
@@ -423,8 +498,14 @@ class MemoryPoolStats:
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> None:
+        data["type"] = MemoryPoolType(data["type"])
         map_build_values_from_raw(data, collection_usage=MemoryCommonUsageStats, peak_usage=MemoryCommonUsageStats, usage=MemoryCommonUsageStats)
 
+    @classmethod
+    def __transform_output__(cls, data: RawDataType) -> None:
+        # the type may be a plain str, the members compare equal to their values
+        data["type"] = MemoryPoolType(data["type"]).value
+
 
 @dataclass
 class MemoryManagerStats:
@@ -438,6 +519,8 @@ class MemoryManagerStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("name", "pools")
+
     name: str
     pools: List[str]
 
@@ -456,6 +539,8 @@ class FrameStats:
         This statistic can be found in `Stats` which is retrieved from Andesite by
         the clients. Both `HTTP` and `WebSocket` are able to get them.
     """
+    __slots__ = ("user", "guild", "success", "loss")
+
     user: int
     guild: int
     success: int
@@ -463,11 +548,13 @@ class FrameStats:
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> None:
-        map_convert_values(data, user=int, guild=int)
+        data["user"] = int(data["user"])
+        data["guild"] = int(data["guild"])
 
     @classmethod
     def __transform_output__(cls, data: RawDataType) -> None:
-        map_convert_values(data, user=str, guild=str)
+        data["user"] = str(data["user"])
+        data["guild"] = str(data["guild"])
 
 
 @dataclass
@@ -488,6 +575,8 @@ class Stats:
         memory_managers (List[MemoryManagerStats]): Memory manager statistics
         frame_stats (List[FrameStats]): Frame statistics
     """
+    __slots__ = ("players", "runtime", "os", "cpu", "class_loading", "thread", "compilation", "memory", "gc",
+                 "memory_pools", "memory_managers", "frame_stats")
 
     players: PlayersStats
     runtime: RuntimeStats
@@ -504,11 +593,19 @@ class Stats:
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> None:
-        map_build_values_from_raw(data,
-                                  players=PlayersStats, runtime=RuntimeStats, os=OSStats, cpu=CPUStats, class_loading=ClassLoadingStats,
-                                  thread=ThreadStats, compilation=CompilationStats, memory=MemoryStats,
-                                  )
+        for key, child_cls in _STATS_CHILDREN:
+            data[key] = build_from_raw(child_cls, data[key])
+
         seq_build_all_items_from_raw(data["gc"], GCStats)
         seq_build_all_items_from_raw(data["memory_pools"], MemoryPoolStats)
         seq_build_all_items_from_raw(data["memory_managers"], MemoryManagerStats)
-        seq_build_all_items_from_raw(data["frame_stats"], FrameStats)
+        # one entry per guild, build them directly instead of going through the generic builder
+        data["frame_stats"] = [FrameStats(int(frame["user"]), int(frame["guild"]), frame["success"], frame["loss"])
+                               for frame in data["frame_stats"]]
+
+
+_STATS_CHILDREN: Tuple[Tuple[str, type], ...] = (
+    ("players", PlayersStats), ("runtime", RuntimeStats), ("os", OSStats), ("cpu", CPUStats),
+    ("class_loading", ClassLoadingStats), ("thread", ThreadStats), ("compilation", CompilationStats),
+    ("memory", MemoryStats),
+)
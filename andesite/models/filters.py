@@ -7,10 +7,12 @@ Attributes:
         can be used as filter maps. This includes the `FilterMap`.
 """
 import abc
+import copy
 from dataclasses import dataclass, field
-from operator import eq
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Set, Type, TypeVar, Union, \
-    overload
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, NoReturn, Optional, Tuple, Type, \
+    TypeVar, Union, overload
 
 from andesite.transform import RawDataType, build_from_raw, convert_to_raw
 
@@ -34,32 +36,37 @@ def _ensure_in_interval(value: float, *,
         ValueError: If the provided value isn't within the given
             constraints.
     """
-    low_symbol: Optional[str] = None
-    up_symbol: Optional[str] = None
-    valid: bool = True
+    if ((low_inc is not None and value < low_inc) or (low is not None and value <= low) or
+            (up_inc is not None and value > up_inc) or (up is not None and value >= up)):
+        _raise_interval_error(value, low=low, low_inc=low_inc, up=up, up_inc=up_inc)
 
+
+def _raise_interval_error(value: float, *,
+                          low: Optional[float], low_inc: Optional[float],
+                          up: Optional[float], up_inc: Optional[float]) -> NoReturn:
+    """Raise the error for a value which isn't within an interval.
+
+    The interval symbols are only built here so that `_ensure_in_interval`
+    doesn't have to format them for valid values.
+
+    Raises:
+        ValueError: Always.
+    """
     if low_inc is not None:
         low_symbol = f"[{low_inc}"
-        if not value >= low:
-            valid = False
     elif low is not None:
         low_symbol = f"({low}"
-        if not value > low:
-            valid = False
+    else:
+        low_symbol = "[-INF"
 
     if up_inc is not None:
         up_symbol = f"{up_inc}]"
-        if not value <= up_inc:
-            valid = False
     elif up is not None:
         up_symbol = f"{up})"
-        if value < up_inc:
-            valid = False
+    else:
+        up_symbol = "INF]"
 
-    if not valid:
-        low_symbol = low_symbol or "[-INF"
-        up_symbol = up_symbol or "INF]"
-        raise ValueError(f"Provided value ({value}) not in interval {low_symbol}, {up_symbol}!")
+    raise ValueError(f"Provided value ({value}) not in interval {low_symbol}, {up_symbol}!")
 
 
 class _Filter(abc.ABC):
@@ -70,6 +77,8 @@ class _Filter(abc.ABC):
             This is a magic attribute used by the library
             to convert the filter into its Andesite representation.
     """
+    __slots__ = ()
+
     __filter_name__: str
 
 
@@ -99,8 +108,18 @@ class Filter(_Filter, abc.ABC):
         if enabled:
             return data
         else:
-            # create a new instance (which uses the defaults) and return its data
-            return convert_to_raw(cls())
+            # send the data of a new instance (which uses the defaults)
+            return copy.deepcopy(_get_default_raw(cls))
+
+
+@lru_cache(maxsize=None)
+def _get_default_raw(cls: Type[Filter]) -> RawDataType:
+    """Get the raw data of a filter which uses the default values.
+
+    The data is only created once per class, make sure to
+    deep copy it before handing it out.
+    """
+    return convert_to_raw(cls())
 
 
 @dataclass
@@ -155,23 +174,18 @@ class Equalizer(Filter):
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, Equalizer):
-            for my_gain, other_gain in zip(self.iter_band_gains(), other.iter_band_gains()):
-                if my_gain != other_gain:
-                    return False
-
-            return True
+            # both lists always have one gain per band
+            return self.iter_band_gains() == other.iter_band_gains()
         else:
             return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.iter_band_gains())
+        return hash(tuple(self.iter_band_gains()))
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> None:
         # Andesite sends the equalizer filter as an array of floats
-        bands = data["bands"]
-        for i, gain in enumerate(bands):
-            bands[i] = EqualizerBand(i, gain)
+        data["bands"] = [EqualizerBand(i, gain) for i, gain in enumerate(data["bands"])]
 
     @classmethod
     def from_gains(cls, gains: Iterable[Optional[float]]) -> "Equalizer":
@@ -181,11 +195,7 @@ class Equalizer(Filter):
             gains: Iterable of `float` which correspond to the gain for the band,
                 or `None` if the band doesn't specify a gain.
         """
-        bands: List[EqualizerBand] = []
-        for i, gain in enumerate(gains):
-            if gain is not None:
-                bands.append(EqualizerBand(i, gain))
-
+        bands = [EqualizerBand(i, gain) for i, gain in enumerate(gains) if gain is not None]
         return cls(True, bands)
 
     @overload
@@ -207,17 +217,16 @@ class Equalizer(Filter):
             band: Band number to get
             create: Whether or not to create a new band if it doesn't exist. (Defaults to True)
         """
-        try:
-            return next(band for band in self.bands if band.band == band)
-        except StopIteration:
-            pass
+        for eq_band in self.bands:
+            if eq_band.band == band:
+                return eq_band
 
         if not create:
             return None
 
-        band = EqualizerBand(band)
-        self.bands.append(band)
-        return band
+        eq_band = EqualizerBand(band)
+        self.bands.append(eq_band)
+        return eq_band
 
     def get_band_gain(self, band: int) -> Optional[float]:
         """Get the gain of a band.
@@ -433,9 +442,9 @@ class VolumeFilter(Filter):
     volume: float = 1.0
 
 
-_FILTERS: Set[Type[Filter]] = {Equalizer, Karaoke, Timescale, Tremolo, Vibrato, VolumeFilter}
-FILTER_MAP: Mapping[str, Type[Filter]] = {andesite_filter.__filter_name__: andesite_filter for andesite_filter in
-                                          _FILTERS}
+_FILTERS: Tuple[Type[Filter], ...] = (Equalizer, Karaoke, Timescale, Tremolo, Vibrato, VolumeFilter)
+FILTER_MAP: Mapping[str, Type[Filter]] = MappingProxyType({andesite_filter.__filter_name__: andesite_filter
+                                                           for andesite_filter in _FILTERS})
 
 
 def get_filter_model(name: str) -> Optional[Type[Filter]]:
@@ -465,26 +474,32 @@ class FilterMap(MutableMapping):
     become outdated.
 
     You can also use this as a wrapper for an existing filter dict.
+    If no filters are passed, the map starts out empty.
     """
+    __slots__ = ("filters",)
 
-    filters: Dict[str, Any] = field(default_factory=dict)
+    filters: Dict[str, Any]
 
-    def __init__(self, filters: "FilterMapLike") -> None:
-        if isinstance(filters, FilterMap):
+    def __init__(self, filters: "FilterMapLike" = None) -> None:
+        if filters is None:
+            self.filters = {}
+        elif isinstance(filters, FilterMap):
             self.filters = filters.filters.copy()
         else:
             self.filters = filters
 
     def __eq__(self, other) -> bool:
         if isinstance(other, FilterMap):
-            return eq(self.filters, other.filters)
-        elif isinstance(other, Mapping):
-            return eq(self.filters, other)
+            return self.filters == other.filters
+        # check for dict first, the Mapping check goes through the ABC machinery
+        elif isinstance(other, (dict, Mapping)):
+            return self.filters == other
         else:
             return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.filters)
+        # the filter values don't have to be hashable, equal maps always have the same names though
+        return hash(frozenset(self.filters))
 
     def __len__(self) -> int:
         return len(self.filters)
@@ -508,16 +523,19 @@ class FilterMap(MutableMapping):
             name: Name of the filter to get
             cls: `Filter` class to use for the filter.
         """
-        try:
-            value = self[name]
-        except KeyError:
-            value = self[name] = cls()
-        else:
-            if not isinstance(value, cls):
-                if isinstance(value, dict):
-                    value = self[name] = build_from_raw(cls, value)
-                else:
-                    raise TypeError(f"Expected {cls}, found {type(value)!r}: {value}")
+        filters = self.filters
+        value = filters.get(name)
+
+        # fast path for the common case where the filter has already been built
+        if type(value) is cls:
+            return value
+
+        if value is None:
+            value = filters[name] = cls()
+        elif isinstance(value, dict):
+            value = filters[name] = build_from_raw(cls, value)
+        elif not isinstance(value, cls):
+            raise TypeError(f"Expected {cls}, found {type(value)!r}: {value}")
 
         return value
 
@@ -549,7 +567,7 @@ class FilterMap(MutableMapping):
     @property
     def volume(self) -> VolumeFilter:
         """Volume filter settings"""
-        return self.get_filter("equalizer", VolumeFilter)
+        return self.get_filter("volume", VolumeFilter)
 
     def set_filter(self, andesite_filter: Filter) -> None:
         """Set the value for a filter.
@@ -561,17 +579,18 @@ class FilterMap(MutableMapping):
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> RawDataType:
+        get_model = FILTER_MAP.get
         filters: RawDataType = {}
 
         for name, filter_value in data.items():
-            filter_cls = get_filter_model(name)
+            filter_cls = get_model(name)
 
             if filter_cls is not None:
                 filter_value = build_from_raw(filter_cls, filter_value)
 
             filters[name] = filter_value
 
-        return dict(filters=filters)
+        return {"filters": filters}
 
     @classmethod
     def __transform_output__(cls, data: RawDataType) -> RawDataType:
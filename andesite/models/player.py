@@ -9,17 +9,20 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, Optional, cast
 
-from andesite.transform import RawDataType, from_centi, from_milli, map_build_all_values_from_raw, \
-    map_build_values_from_raw, map_convert_values, \
-    map_convert_values_from_milli, map_convert_values_to_milli, to_centi, to_milli, transform_input
+from andesite.transform import RawDataType, build_from_raw, map_build_values_from_raw, \
+    map_convert_values, map_convert_values_to_milli, to_centi, to_milli, transform_input
 from .filters import FilterMap
 
 __all__ = ["PlayerFrameStats", "BasePlayer", "MixerPlayer", "MixerMap", "Player"]
 
+_utcfromtimestamp = datetime.utcfromtimestamp
+
 
 @dataclass
 class PlayerFrameStats:
     """Frame statistics of a player."""
+    __slots__ = ("loss", "success", "usable")
+
     loss: int
     success: int
     usable: bool
@@ -42,6 +45,8 @@ class BasePlayer(abc.ABC):
         filters (FilterMap): map of filter name -> filter settings for each filter present
         frame (PlayerFrameStats) Player frame stats
     """
+    __slots__ = ("time", "position", "paused", "volume", "filters", "frame")
+
     time: datetime
     position: Optional[float]
     paused: bool
@@ -68,12 +73,17 @@ class BasePlayer(abc.ABC):
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> None:
-        map_convert_values_from_milli(data, "position")
-        map_convert_values(data, volume=from_centi)
+        position = data.get("position")
+        if position is not None:
+            data["position"] = position / 1000
+
+        volume = data.get("volume")
+        if volume is not None:
+            data["volume"] = volume / 100
+
         map_build_values_from_raw(data, filters=FilterMap, frame=PlayerFrameStats)
 
-        time_float = from_milli(int(data["time"]))
-        data["time"] = datetime.utcfromtimestamp(time_float)
+        data["time"] = _utcfromtimestamp(int(data["time"]) / 1000)
 
     @classmethod
     def __transform_output__(cls, data: RawDataType) -> None:
@@ -89,7 +99,7 @@ class MixerPlayer(BasePlayer):
     See Also:
         `BasePlayer`
     """
-    ...
+    __slots__ = ()
 
 
 MixerMap = Dict[str, MixerPlayer]
@@ -103,11 +113,13 @@ class Player(BasePlayer):
         mixer (MixerMap): map of mixer player id -> mixer player
         mixer_enabled (bool): whether or not the mixer is the current source of audio
     """
+    __slots__ = ("mixer", "mixer_enabled")
+
     mixer: MixerMap
     mixer_enabled: bool
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> RawDataType:
         data = transform_input(super(), data)
-        map_build_all_values_from_raw(data["mixer"], MixerPlayer)
+        data["mixer"] = {key: build_from_raw(MixerPlayer, value) for key, value in data["mixer"].items()}
         return data
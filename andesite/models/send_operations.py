@@ -7,19 +7,21 @@ See Also:
 
 Attributes:
     MixerPlayerUpdateMap (Dict[str, Union[Play, Update]]): (Type alias) str -> `Play`/`Update` map used by the `MixerUpdate`.
+    OP_MAP (Mapping[str, Type[SendOperation]]): Mapping from the op code to
+        the corresponding `SendOperation` type. See: `get_send_operation_model`
 """
 
 import abc
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Mapping, Optional, Tuple, Type, Union
 
-from andesite.transform import RawDataType, build_from_raw, from_centi, from_milli, map_build_values_from_raw, \
-    map_convert_values, map_convert_values_from_milli, map_convert_values_to_milli, to_centi, to_milli
+from andesite.transform import RawDataType, build_from_raw
 from .filters import FilterMap, FilterMapLike
 
 __all__ = ["SendOperation",
            "VoiceServerUpdate",
-           "Play", "Pause", "Seek", "Volume", "FilterUpdate", "Update", "MixerUpdate"]
+           "Play", "Pause", "Seek", "Volume", "FilterUpdate", "Update", "MixerUpdate",
+           "get_send_operation_model"]
 
 
 class SendOperation(abc.ABC):
@@ -29,6 +31,8 @@ class SendOperation(abc.ABC):
     See Also:
         `WebSocket.send_operation`
     """
+    __slots__ = ()
+
     __op__: str
 
 
@@ -40,6 +44,8 @@ class VoiceServerUpdate(SendOperation):
         session_id (str): Session ID for the current user in the event's guild
         event (Dict[str, Any]): Voice server update event sent by discord
     """
+    __slots__ = ("session_id", "event")
+
     __op__ = "voice-server-update"
 
     session_id: str
@@ -69,13 +75,31 @@ class Play(SendOperation):
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> None:
-        map_convert_values_from_milli(data, "start", "end")
-        map_convert_values(data, volume=from_centi)
+        start = data.get("start")
+        if start is not None:
+            data["start"] = start / 1000
+
+        end = data.get("end")
+        if end is not None:
+            data["end"] = end / 1000
+
+        volume = data.get("volume")
+        if volume is not None:
+            data["volume"] = volume / 100
 
     @classmethod
     def __transform_output__(cls, data: RawDataType) -> None:
-        map_convert_values_to_milli(data, "start", "end")
-        map_convert_values(data, volume=to_centi)
+        start = data.get("start")
+        if start is not None:
+            data["start"] = round(1000 * start)
+
+        end = data.get("end")
+        if end is not None:
+            data["end"] = round(1000 * end)
+
+        volume = data.get("volume")
+        if volume is not None:
+            data["volume"] = round(100 * volume)
 
 
 @dataclass
@@ -85,6 +109,8 @@ class Pause(SendOperation):
     Attributes:
         pause (bool): whether or not to pause the player
     """
+    __slots__ = ("pause",)
+
     __op__ = "pause"
 
     pause: bool
@@ -97,17 +123,23 @@ class Seek(SendOperation):
     Attributes:
         position (float): timestamp to set the current track to, in seconds
     """
+    __slots__ = ("position",)
+
     __op__ = "seek"
 
     position: float
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> None:
-        map_convert_values_from_milli(data, "position")
+        position = data.get("position")
+        if position is not None:
+            data["position"] = position / 1000
 
     @classmethod
     def __transform_output__(cls, data: RawDataType) -> None:
-        map_convert_values_to_milli(data, "position")
+        position = data.get("position")
+        if position is not None:
+            data["position"] = round(1000 * position)
 
 
 @dataclass
@@ -117,17 +149,23 @@ class Volume(SendOperation):
     Attributes:
         volume (float): volume to set on the player
     """
+    __slots__ = ("volume",)
+
     __op__ = "volume"
 
     volume: float
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> None:
-        map_convert_values(data, volume=from_centi)
+        volume = data.get("volume")
+        if volume is not None:
+            data["volume"] = volume / 100
 
     @classmethod
     def __transform_output__(cls, data: RawDataType) -> None:
-        map_convert_values(data, volume=to_centi)
+        volume = data.get("volume")
+        if volume is not None:
+            data["volume"] = round(100 * volume)
 
 
 @dataclass
@@ -137,6 +175,8 @@ class FilterUpdate(FilterMap, SendOperation):
     See Also:
         This class inherits from `FilterMap`.
     """
+    __slots__ = ()
+
     __op__ = "filters"
 
     def __init__(self, filters: FilterMapLike) -> None:
@@ -162,12 +202,27 @@ class Update(SendOperation):
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> None:
-        map_convert_values(data, volume=from_centi, position=from_milli)
-        map_build_values_from_raw(data, filters=FilterUpdate)
+        position = data.get("position")
+        if position is not None:
+            data["position"] = position / 1000
+
+        volume = data.get("volume")
+        if volume is not None:
+            data["volume"] = volume / 100
+
+        filters = data.get("filters")
+        if filters is not None:
+            data["filters"] = build_from_raw(FilterUpdate, filters)
 
     @classmethod
     def __transform_output__(cls, data: RawDataType) -> None:
-        map_convert_values(data, volume=to_centi, position=to_milli)
+        position = data.get("position")
+        if position is not None:
+            data["position"] = round(1000 * position)
+
+        volume = data.get("volume")
+        if volume is not None:
+            data["volume"] = round(100 * volume)
 
 
 MixerPlayerUpdateMap = Dict[str, Union[Play, Update]]
@@ -181,6 +236,8 @@ class MixerUpdate(SendOperation):
         enable (Optional[bool]): if present, controls whether or not the mixer should be used
         players (MixerPlayerUpdateMap): map of player id to `Play` / `Update` payloads for each mixer source
     """
+    __slots__ = ("enable", "players")
+
     __op__ = "mixer"
 
     enable: Optional[bool]
@@ -188,11 +245,21 @@ class MixerUpdate(SendOperation):
 
     @classmethod
     def __transform_input__(cls, data: RawDataType) -> None:
-        players = data["players"]
-        for key, value in players.items():
-            try:
-                new_value = build_from_raw(Play, value)
-            except TypeError:
-                new_value = build_from_raw(Update, value)
-
-            players[key] = new_value
+        # only play payloads have a track
+        data["players"] = {key: build_from_raw(Play if "track" in value else Update, value)
+                           for key, value in data["players"].items()}
+
+
+_OPS: Tuple[Type[SendOperation], ...] = (VoiceServerUpdate, Play, Pause, Seek, Volume, FilterUpdate, Update, MixerUpdate)
+OP_MAP: Mapping[str, Type[SendOperation]] = {op.__op__: op for op in _OPS}
+
+
+def get_send_operation_model(op: str) -> Optional[Type[SendOperation]]:
+    """Get the model corresponding to the given op code.
+
+    If no model for the op code exists, `None` is returned.
+
+    Args:
+        op: Op code of the operation
+    """
+    return OP_MAP.get(op)
@@ -9,7 +9,7 @@ from enum import Enum
 from typing import List, Optional
 
 from andesite.transform import RawDataType, build_from_raw, map_build_values_from_raw, map_convert_value, \
-    map_convert_values_from_milli, map_convert_values_to_milli, seq_build_all_items_from_raw
+    map_convert_values_to_milli, seq_build_all_items_from_raw
 from .debug import Error
 
 __all__ = ["PlaylistInfo", "TrackMetadata", "TrackInfo", "LoadType", "LoadedTrack"]
@@ -24,6 +24,8 @@ class PlaylistInfo:
         selected_track: index of the selected track in the tracks list,
             or `None` if no track is selected
     """
+    __slots__ = ("name", "selected_track")
+
     name: str
     selected_track: Optional[int]
 
@@ -58,6 +60,8 @@ class TrackMetadata:
         is_seekable (bool): whether or not the track supports seeking
         position (float): current position of the track
     """
+    __slots__ = ("class_name", "title", "author", "length", "identifier", "uri", "is_stream", "is_seekable", "position")
+
     class_name: str
     title: str
     author: str
@@ -88,15 +92,16 @@ class TrackMetadata:
         data["class_name"] = data.pop("class")
 
         # set length to None if we're dealing with a stream.
-        try:
-            is_stream = data["is_stream"]
-        except KeyError:
-            pass
+        if data.get("is_stream"):
+            data["length"] = None
         else:
-            if is_stream:
-                data["length"] = None
+            length = data.get("length")
+            if length is not None:
+                data["length"] = length / 1000
 
-        map_convert_values_from_milli(data, "length", "position")
+        position = data.get("position")
+        if position is not None:
+            data["position"] = position / 1000
 
     @classmethod
     def __transform_output__(cls, data: RawDataType) -> None:
@@ -112,6 +117,8 @@ class TrackInfo:
         track (str): base64 encoded track
         info (TrackMetadata): metadata of the track
     """
+    __slots__ = ("track", "info")
+
     track: str
     info: TrackMetadata
 
@@ -182,27 +189,20 @@ class LoadedTrack:
     def __transform_input__(cls, data: RawDataType) -> None:
         map_convert_value(data, "load_type", LoadType)
 
-        try:
-            playlist_info = data["playlist_info"]
-        except KeyError:
-            pass
-        else:
+        playlist_info = data.get("playlist_info")
+        if playlist_info:
+            data["playlist_info"] = build_from_raw(PlaylistInfo, playlist_info)
+        elif playlist_info is not None:
             # my god, Andesite now sends an empty object if the playlist_info is null
             # and we absolutely don't want that! So if it's falsy, use None
-            if playlist_info:
-                playlist_info = build_from_raw(PlaylistInfo, playlist_info)
-            else:
-                playlist_info = None
-
-            data["playlist_info"] = playlist_info
+            data["playlist_info"] = None
 
-        map_build_values_from_raw(data, cause=Error)
+        cause = data.get("cause")
+        if cause is not None:
+            data["cause"] = build_from_raw(Error, cause)
 
-        try:
-            tracks = data["tracks"]
-        except KeyError:
-            pass
-        else:
+        tracks = data.get("tracks")
+        if tracks:
             seq_build_all_items_from_raw(tracks, TrackInfo)
 
     @classmethod
@@ -22,20 +22,21 @@ Attributes:
 import abc
 import asyncio
 import dataclasses
-import inspect
 import logging
 import random
 import time
 from collections import defaultdict, deque
 from contextlib import suppress
-from typing import Any, Awaitable, Callable, Collection, Deque, Dict, Generic, Iterable, Iterator, List, Mapping, \
-    MutableMapping, Optional, Set, Tuple, TypeVar, Union
+from typing import Any, AsyncIterator, Awaitable, Callable, Collection, Deque, Dict, Generic, Iterable, Iterator, \
+    List, Mapping, MutableMapping, Optional, Set, Tuple, TypeVar, Union
 from weakref import WeakKeyDictionary, WeakValueDictionary
 
 import aiobservable
+import aiohttp
 import yarl
 
 import andesite
+from .transform import RawDataType
 
 __all__ = ["PoolException", "PoolEmptyError",
            "PoolClientAddEvent", "PoolClientRemoveEvent",
@@ -78,6 +79,8 @@ class PoolClientAddEvent(Generic[CT]):
         pool (ClientPool): Pool the client was added to
         client (CT): Client that was added to the pool
     """
+    __slots__ = ("pool", "client")
+
     pool: "ClientPool"
     client: CT
 
@@ -90,6 +93,8 @@ class PoolClientRemoveEvent(Generic[CT]):
         pool (ClientPool): Pool the client was added to
         client (CT): Client that was added to the pool
     """
+    __slots__ = ("pool", "client")
+
     pool: "ClientPool"
     client: CT
 
@@ -348,6 +353,25 @@ class HTTPPoolBase(ClientPool[andesite.AbstractHTTP], andesite.AbstractHTTP):
                 log.info(f"error during request in {self}: {e}")
                 self._add_penalty(client)
 
+    async def request_tracks_stream(self, identifier: str) -> AsyncIterator[RawDataType]:
+        """Load tracks using one of the clients and yield the raw data of each track.
+
+        Unlike `request` the stream isn't retried on another client
+        if the client fails, tracks might already have been yielded.
+
+        See Also:
+            `AbstractHTTP.request_tracks_stream` for the documentation.
+
+        Raises:
+            PoolEmptyError: If no clients are available
+        """
+        client = self.get_next_client()
+        if client is None:
+            raise PoolEmptyError(self)
+
+        async for track in client.request_tracks_stream(identifier):
+            yield track
+
 
 class HTTPPool(HTTPPoolBase, andesite.HTTPInterface):
     """Andesite HTTP client pool.
@@ -497,7 +521,7 @@ class WebSocketPoolBase(ClientPool[andesite.AbstractWebSocket], andesite.Abstrac
             func: Scoring function to use.
         """
         self._scoring_function = func
-        self._scoring_func_is_coro = inspect.iscoroutine(func)
+        self._scoring_func_is_coro = asyncio.iscoroutinefunction(func)
 
     @property
     def region_comparator(self) -> Optional[RegionGuildComparator]:
@@ -637,12 +661,7 @@ class WebSocketPoolBase(ClientPool[andesite.AbstractWebSocket], andesite.Abstrac
         best_clients: List[andesite.AbstractWebSocket] = []
         best_score: Any = None
 
-        score_fs: List[asyncio.Future] = []
-
-        async def perform_score_calc(_score_data: ScoringData) -> Tuple[andesite.AbstractWebSocket, Any]:
-            return _score_data.client, await self.calculate_score(_score_data)
-
-        loop = asyncio.get_event_loop()
+        score_datas: List[ScoringData] = []
 
         for client, guild_ids in self.iter_client_guild_ids():
             try:
@@ -651,10 +670,22 @@ class WebSocketPoolBase(ClientPool[andesite.AbstractWebSocket], andesite.Abstrac
             except AttributeError:
                 node_region = None
 
-            score_data = ScoringData(self, client, node_region, self.region_comparator, guild_ids, guild_id)
-            score_fs.append(loop.create_task(perform_score_calc(score_data)))
+            score_datas.append(ScoringData(self, client, node_region, self.region_comparator, guild_ids, guild_id))
+
+        scores: List[Tuple[andesite.AbstractWebSocket, Any]]
+        if self._scoring_func_is_coro or type(self).calculate_score is not WebSocketPoolBase.calculate_score:
+            async def perform_score_calc(_score_data: ScoringData) -> Tuple[andesite.AbstractWebSocket, Any]:
+                return _score_data.client, await self.calculate_score(_score_data)
+
+            loop = asyncio.get_event_loop()
+            scores = await asyncio.gather(*(loop.create_task(perform_score_calc(score_data))
+                                            for score_data in score_datas))
+        else:
+            # synchronous scoring functions don't need a task per client,
+            # unless a subclass overrides how the score is calculated
+            scoring_function = self._scoring_function
+            scores = [(score_data.client, scoring_function(score_data)) for score_data in score_datas]
 
-        scores: List[Tuple[andesite.AbstractWebSocket, Any]] = await asyncio.gather(*score_fs)
         for client, score in scores:
             if best_score is not None:
                 if score < best_score:
@@ -743,7 +774,9 @@ def create_pool(http_nodes: Iterable[NodeDetails],
                 user_id: int,
                 state: andesite.StateArgumentType = None,
                 http_pool_kwargs: Mapping[str, Any] = None,
-                web_socket_pool_kwargs: Mapping[str, Any] = None) -> andesite.Client:
+                web_socket_pool_kwargs: Mapping[str, Any] = None,
+                connector: aiohttp.BaseConnector = None,
+                local_decoder: Callable[[str], RawDataType] = None) -> andesite.Client:
     """Create an `Client` with client pools.
 
     Uses `HTTPBase` and `WebSocketBase` which are contained in
@@ -761,6 +794,10 @@ def create_pool(http_nodes: Iterable[NodeDetails],
             constructor.
         web_socket_pool_kwargs: Additional keyword arguments to pass to the web
             socket pool constructor.
+        connector: Connector shared by all http clients.
+            See `HTTPBase` for more details.
+        local_decoder: Local track decoder to use.
+            See `HTTPInterface.local_decoder`.
 
     Returns:
         A combined Andesite client operation on an http pool and a web socket
@@ -768,7 +805,7 @@ def create_pool(http_nodes: Iterable[NodeDetails],
     """
     http_clients = []
     for uri, password in http_nodes:
-        http_clients.append(andesite.HTTPBase(uri, password))
+        http_clients.append(andesite.HTTPBase(uri, password, connector=connector))
 
     web_socket_clients = []
     for uri, password in web_socket_nodes:
@@ -785,4 +822,7 @@ def create_pool(http_nodes: Iterable[NodeDetails],
 
     # the setter will make sure the state is proper
     inst.state = state
+    if local_decoder is not None:
+        inst.local_decoder = local_decoder
+
     return inst
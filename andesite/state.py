@@ -424,15 +424,13 @@ class State(AbstractState, Generic[PST]):
         return player_state
 
     async def handle_player_update(self, update: andesite.PlayerUpdate) -> None:
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug(f"handling player update for {self}: {update}")
+        log.debug("handling player update for %s: %s", self, update)
 
         state = self._get_or_create_player_state(update.guild_id)
         await state.set_player(update.state)
 
     async def handle_andesite_event(self, event: andesite.AndesiteEvent) -> None:
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug(f"handling andesite event for {self}: {event}")
+        log.debug("handling andesite event for %s: %s", self, event)
 
         if isinstance(event, (andesite.TrackEndEvent, andesite.TrackExceptionEvent, andesite.TrackStuckEvent)):
             track = None
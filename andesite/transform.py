@@ -15,8 +15,8 @@ Attributes:
 """
 
 import dataclasses
-from functools import partial
-from typing import Any, Callable, Dict, MutableMapping, MutableSequence, Optional, Type, TypeVar, cast, overload
+from functools import lru_cache
+from typing import Any, Callable, Dict, MutableMapping, MutableSequence, Optional, Tuple, Type, TypeVar, overload
 
 import lettercase
 
@@ -119,6 +119,55 @@ def transform_output(cls: Any, data: RawDataType) -> RawDataType:
         return _transform(transformer, data)
 
 
+# types which convert_to_raw returns as is
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+@lru_cache(maxsize=None)
+def _get_field_names(cls: type) -> Tuple[str, ...]:
+    """Get the names of the fields of a dataclass.
+
+    The names are cached per class.
+    """
+    return tuple(field.name for field in dataclasses.fields(cls))
+
+
+@lru_cache(maxsize=None)
+def _make_raw_converter(cls: type) -> Callable[[Any], RawDataType]:
+    """Create a function which converts instances of the dataclass cls to raw data.
+
+    The output transformer and the snake_case -> dromedaryCase key map
+    are only created once, the converters are cached per class.
+
+    Args:
+        cls: Dataclass whose instances are to be converted
+
+    Returns:
+        Function which takes an instance of cls and behaves like
+        `convert_to_raw` for it.
+    """
+    try:
+        transformer = cls.__transform_output__
+    except AttributeError:
+        transformer = None
+
+    field_names = _get_field_names(cls)
+    key_map = {name: lettercase.snake_to_dromedary_case(name) for name in field_names}
+
+    def converter(obj: Any) -> RawDataType:
+        data: RawDataType = {name: convert_to_raw(getattr(obj, name)) for name in field_names}
+
+        if transformer is not None:
+            # inlined _transform
+            transformed = transformer(data)
+            if transformed is not None:
+                data = transformed
+
+        return {key_map.get(key) or _to_dromedary_case(key): value for key, value in data.items()}
+
+    return converter
+
+
 def convert_to_raw(obj: Any) -> RawDataType:
     """Convert a dataclass to a `dict`.
 
@@ -139,19 +188,11 @@ def convert_to_raw(obj: Any) -> RawDataType:
             `list`, `tuple`, and `dict` objects which will convert its
             members. All other types will be returned without modifying them.
     """
-    if dataclasses.is_dataclass(obj):
-        data: RawDataType = {}
-
-        for field in dataclasses.fields(obj):
-            field = cast(dataclasses.Field, field)
-            value = convert_to_raw(getattr(obj, field.name))
-            data[field.name] = value
-
-        data = transform_output(obj, data)
-
-        lettercase.mut_convert_keys(data, lettercase.SNAKE_CASE, lettercase.DROMEDARY_CASE, memo=CONVERTER_MEMO)
+    if type(obj) in _SCALAR_TYPES:
+        return obj
 
-        return data
+    if dataclasses.is_dataclass(obj):
+        return _make_raw_converter(type(obj))(obj)
     elif isinstance(obj, (list, tuple)):
         return type(obj)(convert_to_raw(value) for value in obj)
     elif isinstance(obj, dict):
@@ -176,6 +217,10 @@ def build_from_raw(cls: Type[T], raw_data: Optional[RawDataType]) -> Optional[T]
     and returned directly instead of handling it in any way.
 
 
+    The keys of the raw data are converted from dromedaryCase to snake_case
+    into a new `dict`. The keys of the fields of cls are converted using a
+    mapping which is created once per class.
+
     The function uses `transform_input`, if the model provides a `__transform_input__` method
     it will be called.
 
@@ -189,17 +234,72 @@ def build_from_raw(cls: Type[T], raw_data: Optional[RawDataType]) -> Optional[T]
     if raw_data is None:
         return None
 
-    lettercase.mut_convert_keys(raw_data, lettercase.DROMEDARY_CASE, lettercase.SNAKE_CASE, memo=CONVERTER_MEMO)
-    raw_data = transform_input(cls, raw_data)
+    return _make_builder(cls)(raw_data)
 
-    return cls(**raw_data)
+
+_to_snake_case = lettercase.memo_converter(lettercase.dromedary_to_snake_case,
+                                           CONVERTER_MEMO.get_memo(lettercase.DROMEDARY_CASE, lettercase.SNAKE_CASE))
+_to_dromedary_case = lettercase.memo_converter(lettercase.snake_to_dromedary_case,
+                                               CONVERTER_MEMO.get_memo(lettercase.SNAKE_CASE, lettercase.DROMEDARY_CASE))
+
+
+def _get_key_map(cls: type) -> Dict[str, str]:
+    """Get the dromedaryCase -> snake_case mapping for the fields of a dataclass.
+
+    Args:
+        cls: Class to get the key map for. If it isn't a dataclass,
+            the key map is empty.
+    """
+    if not dataclasses.is_dataclass(cls):
+        return {}
+
+    return {lettercase.snake_to_dromedary_case(name): name for name in _get_field_names(cls)}
+
+
+@lru_cache(maxsize=None)
+def _make_builder(cls: Type[T]) -> Callable[[RawDataType], T]:
+    """Create a function which builds instances of cls from raw data.
+
+    The input transformer and the key map of the class are only
+    created once, the builders are cached per class.
+
+    Args:
+        cls: Target type to build
+
+    Returns:
+        Function which takes raw data and behaves like `build_from_raw`
+        for non-`None` data.
+    """
+    try:
+        transformer = cls.__transform_input__
+    except AttributeError:
+        transformer = None
+
+    key_map = _get_key_map(cls)
+
+    if transformer is None:
+        def builder(raw_data: RawDataType) -> T:
+            return cls(**{key_map.get(key) or _to_snake_case(key): value for key, value in raw_data.items()})
+    else:
+        def builder(raw_data: RawDataType) -> T:
+            data = {key_map.get(key) or _to_snake_case(key): value for key, value in raw_data.items()}
+
+            # inlined _transform
+            transformed = transformer(data)
+            if transformed is not None:
+                data = transformed
+
+            return cls(**data)
+
+    return builder
 
 
 def seq_build_all_items_from_raw(items: MutableSequence[RawDataType], cls: Type[T]) -> None:
     """Build all items of a mutable sequence.
 
-    This calls `build_from_raw` on all items in the sequence and assigns
-    the result to the index.
+    This behaves like calling `build_from_raw` on all items in the sequence
+    and assigning the result to the index. The builder for cls is only
+    looked up once and the sequence is replaced in a single slice assignment.
 
     Args:
         items: Mutable sequence of raw data to be converted
@@ -208,12 +308,15 @@ def seq_build_all_items_from_raw(items: MutableSequence[RawDataType], cls: Type[
     Returns:
         This method mutates the provided sequence, it does not return anything.
     """
-    for i, value in enumerate(items):
-        items[i] = build_from_raw(cls, value)
+    builder = _make_builder(cls)
+    items[:] = [None if value is None else builder(value) for value in items]
 
 
 MapFunction = Callable[[T], Any]
 
+# sentinel for missing keys, None is a valid value
+_MISSING = object()
+
 
 def map_convert_value(mapping: MutableMapping[KT, T], key: KT, func: MapFunction) -> None:
     """Call a function on the value of a key of the provided mapping.
@@ -235,12 +338,10 @@ def map_convert_value(mapping: MutableMapping[KT, T], key: KT, func: MapFunction
     Returns:
         This method mutates the provided mapping, it does not return anything.
     """
-    try:
-        value = mapping[key]
-    except KeyError:
-        return
-
-    mapping[key] = func(value)
+    # a single probe which doesn't raise for missing keys
+    value = mapping.get(key, _MISSING)
+    if value is not _MISSING:
+        mapping[key] = func(value)
 
 
 def map_convert_values(mapping: RawDataType, **key_funcs: MapFunction) -> None:
@@ -292,8 +393,9 @@ def map_build_values_from_raw(mapping: RawDataType, **key_types: Type[T]) -> Non
         This method mutates the provided mapping, it does not return anything.
     """
     for key, cls in key_types.items():
-        func = partial(build_from_raw, cls)
-        map_convert_value(mapping, key, func)
+        value = mapping.get(key, _MISSING)
+        if value is not _MISSING and value is not None:
+            mapping[key] = _make_builder(cls)(value)
 
 
 def map_build_all_values_from_raw(mapping: MutableMapping[Any, RawDataType], cls: Type[T]) -> None:
@@ -26,6 +26,11 @@ from .transform import build_from_raw, convert_to_raw, map_filter_none, to_centi
 from .web_socket_client_events import RawMsgReceiveEvent, RawMsgSendEvent, WebSocketConnectEvent, \
     WebSocketDisconnectEvent
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = JSONDecoder().decode
+
 __all__ = ["try_connect",
            "AbstractWebSocket", "AbstractWebSocketClient",
            "WebSocketInterface",
@@ -421,8 +426,8 @@ class WebSocketInterface(AbstractWebSocket, abc.ABC):
         if isinstance(track, andesite.Play):
             payload = convert_to_raw(track)
         else:
-            payload = dict(track=track, start=to_milli(start), end=to_milli(end), pause=pause, volume=to_centi(volume),
-                           noReplace=no_replace)
+            payload = {"track": track, "start": to_milli(start), "end": to_milli(end), "pause": pause,
+                       "volume": to_centi(volume), "noReplace": no_replace}
             map_filter_none(payload)
 
         await self.send(guild_id, "play", payload)
@@ -437,7 +442,7 @@ class WebSocketInterface(AbstractWebSocket, abc.ABC):
             guild_id: ID of the guild for which to pause
             pause: `True` to pause, `False` to unpause
         """
-        await self.send(guild_id, "pause", dict(pause=pause))
+        await self.send(guild_id, "pause", {"pause": pause})
 
     async def stop(self, guild_id: int) -> None:
         """Stop a player.
@@ -454,7 +459,7 @@ class WebSocketInterface(AbstractWebSocket, abc.ABC):
             guild_id: ID of the guild for which to seek
             position: Timestamp, in seconds, to seek to
         """
-        payload = dict(position=to_milli(position))
+        payload = {"position": to_milli(position)}
         await self.send(guild_id, "seek", payload)
 
     async def volume(self, guild_id: int, volume: float) -> None:
@@ -464,7 +469,7 @@ class WebSocketInterface(AbstractWebSocket, abc.ABC):
             guild_id: ID of the guild for which to set the volume
             volume: Volume to set
         """
-        payload = dict(volume=to_centi(volume))
+        payload = {"volume": to_centi(volume)}
         await self.send(guild_id, "volume", payload)
 
     @overload
@@ -505,7 +510,7 @@ class WebSocketInterface(AbstractWebSocket, abc.ABC):
             if filters:
                 filters = convert_to_raw(filters)
 
-            payload = dict(pause=pause, position=to_milli(position), volume=to_centi(volume), filters=filters)
+            payload = {"pause": pause, "position": to_milli(position), "volume": to_centi(volume), "filters": filters}
             map_filter_none(payload)
 
         await self.send(guild_id, "update", payload)
@@ -572,15 +577,15 @@ class WebSocketInterface(AbstractWebSocket, abc.ABC):
         if isinstance(filter_update, andesite.FilterUpdate):
             payload = convert_to_raw(filter_update)
         else:
-            payload = convert_to_raw(dict(
-                equalizer=equalizer,
-                karaoke=karaoke,
-                timescale=timescale,
-                tremolo=tremolo,
-                vibrato=vibrato,
-                volume=volume,
+            payload = convert_to_raw({
+                "equalizer": equalizer,
+                "karaoke": karaoke,
+                "timescale": timescale,
+                "tremolo": tremolo,
+                "vibrato": vibrato,
+                "volume": volume,
                 **custom_filters
-            ))
+            })
 
         await self.send(guild_id, "filters", payload)
 
@@ -643,7 +648,7 @@ class WebSocketInterface(AbstractWebSocket, abc.ABC):
             If you wish to send a `VoiceServerUpdate` operation, please
             use the `send_operation` method directly.
         """
-        payload = dict(sessionId=session_id, event=event)
+        payload = {"sessionId": session_id, "event": event}
         await self.send(guild_id, "voice-server-update", payload)
 
 
@@ -694,7 +699,6 @@ class WebSocketBase(AbstractWebSocketClient):
     __read_loop: Optional[asyncio.Future]
 
     _json_encoder: JSONEncoder
-    _json_decoder: JSONDecoder
 
     def __init__(self, ws_uri: Union[str, URL], user_id: Optional[int], password: Optional[str], *,
                  state: andesite.StateArgumentType = False,
@@ -723,7 +727,6 @@ class WebSocketBase(AbstractWebSocketClient):
         self.__read_loop = None
 
         self._json_encoder = JSONEncoder()
-        self._json_decoder = JSONDecoder()
 
         self.state = state
 
@@ -896,7 +899,7 @@ class WebSocketBase(AbstractWebSocketClient):
 
         def handle_msg(raw_msg: str) -> None:
             try:
-                data: Dict[str, Any] = self._json_decoder.decode(raw_msg)
+                data: Dict[str, Any] = _json_loads(raw_msg)
             except JSONDecodeError as e:
                 log.error(f"Couldn't parse received JSON data in {self}: {e}\nmsg: {raw_msg}")
                 return
@@ -948,8 +951,7 @@ class WebSocketBase(AbstractWebSocketClient):
                 await self.connect()
                 continue
 
-            if log.isEnabledFor(logging.DEBUG):
-                log.debug(f"Received message in {self}: {raw_msg}")
+            log.debug("Received message in %s: %s", self, raw_msg)
 
             try:
                 handle_msg(raw_msg)
@@ -26,6 +26,8 @@ class WebSocketConnectEvent:
         client (AbstractWebSocketClient): Web socket client which
             connected.
     """
+    __slots__ = ("client",)
+
     client: andesite.AbstractWebSocketClient
 
 
@@ -37,6 +39,7 @@ class WebSocketDisconnectEvent:
         client (AbstractWebSocketClient): Web socket client which connected.
         deliberate (bool): Whether the disconnect was deliberate.
     """
+    __slots__ = ("client", "deliberate")
 
     client: andesite.AbstractWebSocketClient
     deliberate: bool
@@ -54,6 +57,8 @@ class RawMsgReceiveEvent:
             than being loaded from the raw JSON string.
             For example, the names are still in dromedaryCase.
     """
+    __slots__ = ("client", "body")
+
     client: andesite.AbstractWebSocketClient
     body: Dict[str, Any]
 
@@ -72,6 +77,8 @@ class RawMsgSendEvent:
         op (str): Op-code to be executed
         body (Dict[str, Any]): Raw body of the message
     """
+    __slots__ = ("client", "guild_id", "op", "body")
+
     client: andesite.AbstractWebSocketClient
     guild_id: int
     op: str
@@ -26,4 +26,8 @@ setuptools.setup(
         "websockets",
         "yarl",
     ],
+    extras_require={
+        "speedups": ["orjson"],
+        "streaming": ["ijson>=3"],
+    },
 )
@@ -0,0 +1,148 @@
+import gc
+import warnings
+from unittest import mock
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from andesite import AndesiteException, Client, HTTP, HTTPBase, HTTPError, HTTPPool
+
+
+@pytest.mark.asyncio
+async def test_shared_connector():
+    connector = aiohttp.TCPConnector()
+
+    http = HTTPBase("http://localhost:5555", None, connector=connector)
+    old_session = http.aiohttp_session
+    assert old_session.connector is connector
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always", ResourceWarning)
+
+        await http.reset()
+        assert old_session.closed
+        assert not connector.closed
+        assert http.aiohttp_session.connector is connector
+
+        await http.close()
+        assert not connector.closed
+
+        del old_session
+        gc.collect()
+
+    assert not [w for w in caught if issubclass(w.category, ResourceWarning)]
+
+    await connector.close()
+
+
+@pytest.mark.asyncio
+async def test_external_session():
+    session = aiohttp.ClientSession()
+
+    http = HTTPBase("http://localhost:5555", None, session=session)
+    assert http.aiohttp_session is session
+
+    await http.reset()
+    assert http.aiohttp_session is session
+
+    await http.close()
+    assert not session.closed
+
+    await session.close()
+
+
+@pytest.mark.asyncio
+async def test_context_manager():
+    async with HTTPBase("http://localhost:5555", None, limit=5, limit_per_host=2) as http:
+        connector = http.aiohttp_session.connector
+        assert connector.limit == 5
+        assert connector.limit_per_host == 2
+
+    assert http.closed
+    assert connector.closed
+
+
+@pytest.fixture(params=[True, False], ids=["ijson", "no-ijson"])
+def stream_parser(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setattr("andesite.http_client.ijson", None)
+
+    return request.param
+
+
+@pytest.fixture()
+def loadtracks_app() -> web.Application:
+    track = {"track": "abc", "info": {"class": "YoutubeAudioTrack", "title": "title", "author": "author",
+                                      "length": 1000, "identifier": "abc", "uri": "https://example.com",
+                                      "isStream": False, "isSeekable": True, "position": 0}}
+    cause = {"class": "FriendlyException", "message": "unavailable", "stack": [], "suppressed": [], "cause": None}
+
+    async def handler(request: web.Request) -> web.Response:
+        identifier = request.query["identifier"]
+        if identifier == "invalid":
+            return web.json_response({"code": 400, "message": "invalid identifier"}, status=400)
+        elif identifier == "gateway":
+            return web.Response(text="<html>Bad Gateway</html>", status=502)
+        elif identifier == "failed":
+            return web.json_response({"loadType": "LOAD_FAILED", "tracks": None, "cause": cause,
+                                      "severity": "COMMON"})
+        elif identifier == "none":
+            return web.json_response({"loadType": "NO_MATCHES", "tracks": None})
+
+        return web.json_response({"loadType": "SEARCH_RESULT", "tracks": [track, track], "playlistInfo": {}})
+
+    app = web.Application()
+    app.router.add_get("/loadtracks", handler)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_load_tracks_stream(stream_parser, loadtracks_app):
+    async with TestServer(loadtracks_app) as server, HTTP(server.make_url("/"), None) as http:
+        tracks = [track async for track in http.load_tracks_stream("search")]
+        assert [track.info.length for track in tracks] == [1, 1]
+
+        assert [track async for track in http.load_tracks_stream("none")] == []
+
+        with pytest.raises(AndesiteException) as exc_info:
+            _ = [track async for track in http.load_tracks_stream("failed")]
+
+        assert exc_info.value.message == "unavailable"
+
+        with pytest.raises(HTTPError):
+            _ = [track async for track in http.load_tracks_stream("invalid")]
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            _ = [track async for track in http.load_tracks_stream("gateway")]
+
+
+@pytest.mark.asyncio
+async def test_load_tracks_stream_client(loadtracks_app):
+    async with TestServer(loadtracks_app) as server, HTTPBase(server.make_url("/"), None) as http:
+        client = Client(http, mock.Mock())
+        tracks = [track async for track in client.load_tracks_stream("search")]
+        assert len(tracks) == 2
+
+        pool = HTTPPool([http])
+        tracks = [track async for track in pool.load_tracks_stream("search")]
+        assert len(tracks) == 2
+
+
+@pytest.mark.asyncio
+async def test_request_error_null_message():
+    async def handler(_: web.Request) -> web.Response:
+        return web.json_response({"code": 500, "message": None}, status=500)
+
+    app = web.Application()
+    app.router.add_get("/stats", handler)
+
+    async with TestServer(app) as server, HTTPBase(server.make_url("/"), None) as http:
+        with pytest.raises(HTTPError) as exc_info:
+            await http.request("GET", "stats")
+
+        assert exc_info.value.code == 500
+        assert exc_info.value.message is None
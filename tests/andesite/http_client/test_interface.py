@@ -1,3 +1,4 @@
+import asyncio
 from unittest import mock
 
 import pytest
@@ -16,17 +17,37 @@ class MockAndesiteHTTP(HTTPInterface):
     request = AsyncMock()
 
 
+class RecordingAndesiteHTTP(MockAndesiteHTTP):
+    def __init__(self) -> None:
+        self.requested = []
+
+    async def request(self, method, path, *, json):
+        self.requested.append((path, json))
+        return [track.upper() for track in json]
+
+
 @pytest.fixture()
 def http_client() -> MockAndesiteHTTP:
     return MockAndesiteHTTP()
 
 
+@pytest.fixture()
+def recording_http_client() -> RecordingAndesiteHTTP:
+    return RecordingAndesiteHTTP()
+
+
 @pytest.fixture()
 def mocked_build():
     with mock.patch("andesite.http_client.build_from_raw") as mocked:
         yield mocked
 
 
+@pytest.fixture()
+def mocked_seq_build():
+    with mock.patch("andesite.http_client.seq_build_all_items_from_raw") as mocked:
+        yield mocked
+
+
 @pytest.mark.asyncio
 async def test_get_stats(http_client: MockAndesiteHTTP, mocked_build: mock.Mock):
     await http_client.get_stats()
@@ -49,3 +70,50 @@ async def test_load_tracks_safe(http_client: MockAndesiteHTTP, mocked_build: moc
 
     mocked_build.assert_called_once()
     http_client.request.assert_called_with("GET", "loadtracks", params={"identifier": "raw:something"})
+
+
+@pytest.mark.asyncio
+async def test_decode_tracks_chunked(recording_http_client: RecordingAndesiteHTTP, mocked_seq_build: mock.Mock):
+    tracks = await recording_http_client.decode_tracks(["a", "b", "c", "d", "e"], chunk_size=2)
+
+    mocked_seq_build.assert_called_once()
+    assert recording_http_client.requested == [("decodetracks", ["a", "b"]),
+                                               ("decodetracks", ["c", "d"]),
+                                               ("decodetracks", ["e"])]
+    assert tracks == ["A", "B", "C", "D", "E"]
+
+
+@pytest.mark.asyncio
+async def test_decode_tracks_local_decoder(http_client: MockAndesiteHTTP, mocked_seq_build: mock.Mock):
+    http_client.local_decoder = lambda track: {"track": track}
+    http_client.request = mock.Mock()
+
+    tracks = await http_client.decode_tracks(["a", "b"])
+
+    http_client.request.assert_not_called()
+    assert tracks == [{"track": "a"}, {"track": "b"}]
+
+
+@pytest.mark.asyncio
+async def test_decode_track_batched(recording_http_client: RecordingAndesiteHTTP, mocked_seq_build: mock.Mock):
+    tracks = await asyncio.gather(*(recording_http_client.decode_track(track) for track in ("a", "b", "c")))
+
+    assert recording_http_client.requested == [("decodetracks", ["a", "b", "c"])]
+    assert tracks == ["A", "B", "C"]
+
+
+@pytest.mark.asyncio
+async def test_decode_tracks_cached(recording_http_client: RecordingAndesiteHTTP, mocked_seq_build: mock.Mock):
+    assert await recording_http_client.decode_tracks(["a", "b"]) == ["A", "B"]
+    assert await recording_http_client.decode_tracks(["b", "c", "a", "c"]) == ["B", "C", "A", "C"]
+
+    assert recording_http_client.requested == [("decodetracks", ["a", "b"]), ("decodetracks", ["c"])]
+
+
+@pytest.mark.asyncio
+async def test_search_tracks(http_client: MockAndesiteHTTP, mocked_build: mock.Mock):
+    await http_client.search_tracks("something")
+    http_client.request.assert_called_with("GET", "loadtracks", params={"identifier": "ytsearch:something"})
+
+    await http_client.search_tracks("something", searcher="soundcloud")
+    http_client.request.assert_called_with("GET", "loadtracks", params={"identifier": "scsearch:something"})
@@ -1,9 +1,9 @@
 import pytest
 
 from andesite import AndesiteException, CPUStats, ClassLoadingStats, CompilationStats, Error, FrameStats, GCStats, MemoryCommonUsageStats, \
-    MemoryManagerStats, MemoryPoolStats, MemoryStats, OSStats, PlayersStats, RuntimeSpecStats, RuntimeStats, RuntimeVMStats, RuntimeVersionStats, \
+    MemoryManagerStats, MemoryPoolStats, MemoryPoolType, MemoryStats, OSStats, PlayersStats, RuntimeSpecStats, RuntimeStats, RuntimeVMStats, RuntimeVersionStats, \
     StackFrame, Stats, ThreadStats
-from andesite.transform import build_from_raw
+from andesite.transform import build_from_raw, convert_to_raw
 
 
 def test_stats_load():
@@ -172,3 +172,65 @@ def test_error_to_python():
         StackFrame(None, "java.base", "11.0.2", "java.lang.Thread", "run", "Thread.java", 834, "java.base/java.lang.Thread.run(Thread.java:834)")
     ]
     assert exc_info.value.suppressed == []
+
+
+def test_stack_frame_str():
+    frame = StackFrame(None, "java.base", "11.0.2", "java.lang.Thread", "run", "Thread.java", 834, "java.base/java.lang.Thread.run(Thread.java:834)")
+    assert str(frame) == "module java.base, file Thread.java, line 834, java.lang.Thread#run"
+
+    frame = StackFrame("app", None, None, "java.lang.Thread", "run", None, None, "java.lang.Thread.run(Unknown Source)")
+    assert str(frame) == "java.lang.Thread#run"
+
+
+def test_error_load_deep_cause():
+    raw_data = None
+    for i in range(2000):
+        raw_data = {"class": "java.lang.RuntimeException", "message": str(i), "stack": [], "suppressed": [], "cause": raw_data}
+
+    error = build_from_raw(Error, raw_data)
+
+    exc = error.as_python_exception()
+    for i in reversed(range(2000)):
+        assert exc.message == str(i)
+        exc = exc.__cause__
+
+    assert exc is None
+
+    depth = 0
+    while error.cause is not None:
+        assert error.message == str(1999 - depth)
+        error = error.cause
+        depth += 1
+
+    assert depth == 1999
+    assert error.message == "0"
+
+
+def test_stack_frame_load_interned():
+    raw_frames = [{"classLoader": "app", "moduleName": None, "moduleVersion": None,
+                   "className": "".join(["java.lang.", "Thread"]), "methodName": "run", "fileName": "Thread.java",
+                   "lineNumber": 834, "pretty": "java.lang.Thread.run(Thread.java:834)"}
+                  for _ in range(2)]
+
+    first, second = (build_from_raw(StackFrame, raw) for raw in raw_frames)
+
+    assert first == second
+    assert first.class_name is second.class_name
+    assert first.module_name is None
+
+
+def test_memory_pool_type():
+    raw_data = {"name": "CodeCache", "type": "NON_HEAP",
+                "collectionUsage": None, "collectionUsageThreshold": None, "collectionUsageThresholdCount": None,
+                "peakUsage": {"init": 0, "used": 8723456, "committed": 268435456, "max": 268435456},
+                "usage": {"init": 0, "used": 8723456, "committed": 268435456, "max": 268435456},
+                "usageThreshold": 0, "usageThresholdCount": 0, "managers": ["CodeCacheManager"]}
+
+    pool = build_from_raw(MemoryPoolStats, raw_data)
+    assert pool.type is MemoryPoolType.NON_HEAP
+    assert pool.type == "NON_HEAP"
+
+    assert convert_to_raw(pool)["type"] == "NON_HEAP"
+
+    pool.type = "HEAP"
+    assert convert_to_raw(pool)["type"] == "HEAP"
@@ -1,4 +1,6 @@
-from andesite import FilterMap, Karaoke
+import pytest
+
+from andesite import Equalizer, EqualizerBand, FilterMap, Karaoke, Timescale, Vibrato, VolumeFilter
 from andesite.transform import build_from_raw, convert_to_raw
 
 
@@ -25,3 +27,90 @@ def test_filter_map_to_raw():
                                "monoLevel": 1.0}}
 
     assert build_from_raw(FilterMap, raw) == f
+
+
+def test_filter_map_default_empty():
+    f = FilterMap()
+    assert f.filters == {}
+    assert convert_to_raw(f) == {}
+
+    f.set_filter(Karaoke())
+    assert FilterMap().filters == {}
+
+
+def test_equalizer_get_band():
+    equalizer = Equalizer.from_gains([None, 0.5, None, -0.25])
+
+    assert equalizer.get_band(1) is equalizer.bands[0]
+    assert equalizer.get_band(3) is equalizer.bands[1]
+
+    assert equalizer.get_band(2, create=False) is None
+    assert equalizer.get_band_gain(2) is None
+
+    band = equalizer.get_band(2)
+    assert band == EqualizerBand(2)
+    assert equalizer.bands[-1] is band
+    assert len(equalizer.bands) == 3
+
+
+def test_filter_setters():
+    equalizer = Equalizer.from_gains([None, 0.5])
+    equalizer.set_band_gain(1, 0.75)
+    assert equalizer.get_band_gain(1) == 0.75
+
+    with pytest.raises(ValueError, match=r"\[-0\.25, 1\]"):
+        equalizer.set_band_gain(1, 1.5)
+
+    timescale = Timescale()
+    timescale.set_speed(2)
+    assert timescale.speed == 2
+
+    with pytest.raises(ValueError, match=r"\(0, INF\]"):
+        timescale.set_speed(0)
+
+    vibrato = Vibrato()
+    vibrato.set_frequency(14)
+
+    with pytest.raises(ValueError):
+        vibrato.set_frequency(14.5)
+
+
+def test_equalizer_from_raw():
+    equalizer = build_from_raw(Equalizer, {"enabled": True, "bands": [0.0, 0.25, -0.25]})
+
+    assert equalizer.bands == [EqualizerBand(0, 0.0), EqualizerBand(1, 0.25), EqualizerBand(2, -0.25)]
+    assert equalizer == Equalizer.from_gains([0.0, 0.25, -0.25])
+
+
+def test_filter_hash():
+    assert hash(Equalizer.from_gains([0.0, 0.25])) == hash(Equalizer.from_gains([0.0, 0.25]))
+    assert hash(FilterMap(dict(karaoke=Karaoke()))) == hash(FilterMap(dict(karaoke=Karaoke())))
+
+
+def test_disabled_filter_to_raw():
+    raw = convert_to_raw(Timescale(False, speed=2.0))
+    assert raw == {"speed": 1.0, "pitch": 1.0, "rate": 1.0}
+
+    raw["speed"] = 3.0
+    assert convert_to_raw(Timescale(False)) == {"speed": 1.0, "pitch": 1.0, "rate": 1.0}
+
+
+def test_filter_map_properties():
+    f = FilterMap({"volume": {"enabled": True, "volume": 0.5}})
+
+    assert f.volume == VolumeFilter(True, 0.5)
+    assert f.volume is f["volume"]
+
+    assert f.equalizer == Equalizer()
+    assert set(f) == {"volume", "equalizer"}
+
+    f["karaoke"] = "invalid"
+    with pytest.raises(TypeError):
+        _ = f.karaoke
+
+
+def test_disabled_filter_to_raw_nested():
+    raw = convert_to_raw(Equalizer(False))
+    raw["bands"].append({"band": 0, "gain": 0.5})
+
+    assert convert_to_raw(Equalizer(False)) == {"bands": []}
@@ -0,0 +1,40 @@
+from andesite import FilterUpdate, MixerUpdate, Play, Seek, Update, Volume, VoiceServerUpdate, get_send_operation_model
+from andesite.transform import build_from_raw, convert_to_raw
+
+
+def test_play_raw():
+    raw = {"track": "abc", "start": 1500, "end": None, "pause": None, "volume": 50, "noReplace": False}
+    play = build_from_raw(Play, raw.copy())
+
+    assert play == Play("abc", start=1.5, volume=.5)
+    assert convert_to_raw(play) == raw
+
+
+def test_update_raw():
+    raw = {"pause": True, "position": 2000, "volume": 120, "filters": None}
+    update = build_from_raw(Update, raw.copy())
+
+    assert update == Update(pause=True, position=2.0, volume=1.2)
+    assert convert_to_raw(update) == raw
+
+
+def test_seek_volume_raw():
+    assert build_from_raw(Seek, {"position": 3500}) == Seek(3.5)
+    assert convert_to_raw(Seek(3.5)) == {"position": 3500}
+
+    assert build_from_raw(Volume, {"volume": 75}) == Volume(.75)
+    assert convert_to_raw(Volume(.75)) == {"volume": 75}
+
+
+def test_mixer_update_from_raw():
+    raw = {"enable": True, "players": {"a": {"track": "abc", "volume": 50}, "b": {"pause": True}}}
+    mixer_update = build_from_raw(MixerUpdate, raw)
+
+    assert mixer_update == MixerUpdate(True, {"a": Play("abc", volume=.5), "b": Update(pause=True)})
+
+
+def test_get_send_operation_model():
+    assert get_send_operation_model("play") is Play
+    assert get_send_operation_model("voice-server-update") is VoiceServerUpdate
+    assert get_send_operation_model("filters") is FilterUpdate
+    assert get_send_operation_model("unknown") is None
@@ -1,9 +1,9 @@
-from typing import cast
+from typing import Any, cast
 from unittest import mock
 
 import pytest
 
-from andesite import AbstractWebSocket, WebSocketPool
+from andesite import AbstractWebSocket, ScoringData, WebSocketPool
 from tests.andesite.async_mock import AsyncMock
 
 
@@ -46,3 +46,16 @@ async def test_ws_pool():
 
     await pool.play(1234, "lol track")
     assert cast(AsyncMock, assigned_client.send).called_with(1234, "play", {"track": "lol track"})
+
+
+@pytest.mark.asyncio
+async def test_ws_pool_calculate_score_override():
+    client_a = MockWebSocket()
+    client_b = MockWebSocket()
+
+    class PreferringPool(WebSocketPool):
+        async def calculate_score(self, data: ScoringData) -> Any:
+            return data.client is client_b
+
+    pool = PreferringPool([client_a, client_b])
+    assert await pool.find_best_client(1234) is client_b
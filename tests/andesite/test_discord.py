@@ -1,4 +1,6 @@
-from andesite.discord import compare_regions
+import pytest
+
+from andesite.discord import AsyncMethodGroup, compare_regions
 
 
 def test_compare_regions():
@@ -7,3 +9,22 @@ def test_compare_regions():
     assert compare_regions("vip-us-west", "us") == 2
     assert compare_regions("us-west", "vip-us") == 2
     assert compare_regions("london", "japan") == 0
+
+
+@pytest.mark.asyncio
+async def test_async_method_group():
+    calls = []
+
+    async def first(value):
+        calls.append(("first", value))
+
+    async def second(value):
+        calls.append(("second", value))
+
+    group = AsyncMethodGroup([first])
+    await group(1)
+    assert calls == [("first", 1)]
+
+    group.methods.add(second)
+    await group(2)
+    assert sorted(calls[1:]) == [("first", 2), ("second", 2)]
@@ -94,6 +94,14 @@ def test_seq_build_all_items_from_raw():
     assert values == [NestedTest(5, 3), NestedTest(.3, 5), NestedTest(.5, 2)]
 
 
+def test_seq_build_all_items_from_raw_none():
+    values = [{"coolThing": 5000, "test": 3}, None]
+
+    seq_build_all_items_from_raw(values, NestedTest)
+
+    assert values == [NestedTest(5, 3), None]
+
+
 def test_map_build_all_values_from_raw():
     data = {
         "key": {"coolThing": 5000, "test": 3},